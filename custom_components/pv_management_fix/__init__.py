@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import calendar
 import logging
 from datetime import datetime, date, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback, Event
 from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 
 from .const import (
     DOMAIN, DATA_CTRL, PLATFORMS,
@@ -28,12 +34,52 @@ from .const import (
     DEFAULT_QUOTA_SEASONAL, SEASONAL_FACTORS,
     PRICE_UNIT_CENT,
 )
+from .helpers import tick_cached_by
 
 _LOGGER = logging.getLogger(__name__)
 
 # CO2 Faktor für deutschen Strommix (kg CO2 pro kWh)
 CO2_FACTOR_GRID = 0.4
 
+# Mindestabstand (s) zwischen zwei Entity-Updates - schnelle Folgen werden gebündelt
+NOTIFY_COOLDOWN = 0.25
+
+
+def _safe_float(val, default: float = 0.0) -> float:
+    """float() mit Default für None/ungültige Werte (Restore)."""
+    try:
+        return float(val) if val is not None else default
+    except (ValueError, TypeError):
+        return default
+
+
+# Controller-Property, die pro update_id nur einmal berechnet wird. Nur für Werte,
+# die ausschließlich von getrackten Zählern und Optionen abhängen - beide ändern
+# sich nie ohne _notify_entities().
+tick_cached = tick_cached_by(attrgetter("update_id"))
+
+
+@lru_cache(maxsize=32)
+def _seasonal_expected(from_date: date, to_date: date, yearly_kwh: float) -> float:
+    """Saisonaler Soll-Verbrauch zwischen zwei Daten.
+
+    Gecacht, da sich die Eingaben höchstens täglich ändern, die Schleife
+    aber bei jedem Lesen der Kontingent-Sensoren laufen würde.
+    """
+    total = 0.0
+    current = from_date
+    while current < to_date:
+        # Monatsweise: Tage im Monat (bis to_date) x Tageswert des Monats
+        year, month = current.year, current.month
+        days_in_month = calendar.monthrange(year, month)[1]
+        month_end = date(year, month, days_in_month) + timedelta(days=1)
+        segment_end = min(month_end, to_date)
+        factor = SEASONAL_FACTORS.get(month, 1.0)
+        daily_value = (factor / 12.0) * yearly_kwh / days_in_month
+        total += (segment_end - current).days * daily_value
+        current = segment_end
+    return total
+
 
 class PVManagementFixController:
     """
@@ -98,9 +144,20 @@ class PVManagementFixController:
         self._restored = False
         self._first_seen_date: date | None = None
 
-        # Listener
+        # Listener (Entities hängen am Dispatcher-Signal)
         self._remove_listeners = []
-        self._entity_listeners = []
+        self.signal_update = f"{DOMAIN}_{entry.entry_id}_update"
+        self._notify_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=NOTIFY_COOLDOWN,
+            immediate=True,
+            function=self._send_update,
+        )
+
+        # Wird bei jeder Wertänderung erhöht - Entities überspringen Updates ohne Änderung
+        self.update_id = 0
+        self._tick_cache: dict[str, tuple[int, Any]] = {}
 
     def _load_options(self):
         """Lädt Optionen aus Entry (Options überschreiben Data)."""
@@ -256,7 +313,7 @@ class PVManagementFixController:
     # STROMPREIS-DURCHSCHNITT
     # =========================================================================
 
-    @property
+    @tick_cached
     def average_electricity_price(self) -> float | None:
         """Gewichteter durchschnittlicher Strompreis in €/kWh."""
         if self._tracked_grid_import_kwh <= 0:
@@ -309,7 +366,7 @@ class PVManagementFixController:
     # SPOT VS FIXPREIS VERGLEICH
     # =========================================================================
 
-    @property
+    @tick_cached
     def spot_vs_fixed_savings(self) -> float | None:
         """
         Ersparnis Fixpreis gegenüber Spot-Tarif.
@@ -346,7 +403,6 @@ class PVManagementFixController:
         start = self.quota_start_date
         if start is None:
             return None
-        from datetime import timedelta
         return start + timedelta(days=365)
 
     @property
@@ -391,17 +447,7 @@ class PVManagementFixController:
 
     def _quota_seasonal_expected(self, from_date: date, to_date: date) -> float:
         """Berechnet den saisonalen Soll-Verbrauch zwischen zwei Daten."""
-        import calendar
-        total = 0.0
-        current = from_date
-        while current < to_date:
-            month = current.month
-            days_in_month = calendar.monthrange(current.year, month)[1]
-            factor = SEASONAL_FACTORS.get(month, 1.0)
-            daily_value = (factor / 12.0) * self.quota_yearly_kwh / days_in_month
-            total += daily_value
-            current += timedelta(days=1)
-        return total
+        return _seasonal_expected(from_date, to_date, self.quota_yearly_kwh)
 
     def _quota_seasonal_fraction(self, from_date: date, to_date: date) -> float:
         """Berechnet den saisonalen Anteil der Periode (0.0 - 1.0)."""
@@ -471,20 +517,20 @@ class PVManagementFixController:
         """Einnahmen durch Einspeisung."""
         return self._accumulated_earnings_feed
 
-    @property
+    @tick_cached
     def total_savings(self) -> float:
         """Gesamtersparnis inkl. manuellem Offset."""
         base = self.savings_self_consumption + self.earnings_feed_in
         return base + self.savings_offset
 
-    @property
+    @tick_cached
     def amortisation_percent(self) -> float:
         """Amortisation in Prozent."""
         if self.installation_cost <= 0:
             return 100.0
         return min(100.0, (self.total_savings / self.installation_cost) * 100)
 
-    @property
+    @tick_cached
     def remaining_cost(self) -> float:
         """Restbetrag bis zur Amortisation."""
         return max(0.0, self.installation_cost - self.total_savings)
@@ -573,7 +619,6 @@ class PVManagementFixController:
             return None
         if remaining == 0:
             return date.today()
-        from datetime import timedelta
         return date.today() + timedelta(days=remaining)
 
     @property
@@ -589,41 +634,27 @@ class PVManagementFixController:
     # ENTITY MANAGEMENT
     # =========================================================================
 
-    def register_entity_listener(self, cb) -> None:
-        """Sensoren registrieren sich hier für Updates."""
-        if cb not in self._entity_listeners:
-            self._entity_listeners.append(cb)
-
-    def unregister_entity_listener(self, cb) -> None:
-        """Entfernt einen Entity-Listener."""
-        try:
-            self._entity_listeners.remove(cb)
-        except ValueError:
-            pass
+    def _notify_entities(self, changed: bool = True) -> None:
+        """Informiert alle Entities über Zustandsänderungen (gebündelt)."""
+        if changed:
+            self.update_id += 1
+        # async_call statt async_schedule_call - letzteres gibt es erst nach HA 2024.1
+        self.hass.async_create_task(self._notify_debouncer.async_call())
 
-    def _notify_entities(self) -> None:
-        """Informiert alle Entities über Zustandsänderungen."""
-        for cb in list(self._entity_listeners):
-            try:
-                cb()
-            except Exception as e:
-                _LOGGER.debug("Entity-Listener Fehler (ignoriert): %s", e)
+    @callback
+    def _send_update(self) -> None:
+        """Schickt das Update-Signal an alle Entities."""
+        async_dispatcher_send(self.hass, self.signal_update)
 
     def restore_state(self, data: dict[str, Any]) -> None:
         """Stellt den gespeicherten Zustand wieder her."""
-        def safe_float(val, default=0.0):
-            try:
-                return float(val) if val is not None else default
-            except (ValueError, TypeError):
-                return default
-
-        self._total_self_consumption_kwh = safe_float(data.get("total_self_consumption_kwh"))
-        self._total_feed_in_kwh = safe_float(data.get("total_feed_in_kwh"))
-        self._accumulated_savings_self = safe_float(data.get("accumulated_savings_self"))
-        self._accumulated_earnings_feed = safe_float(data.get("accumulated_earnings_feed"))
+        self._total_self_consumption_kwh = _safe_float(data.get("total_self_consumption_kwh"))
+        self._total_feed_in_kwh = _safe_float(data.get("total_feed_in_kwh"))
+        self._accumulated_savings_self = _safe_float(data.get("accumulated_savings_self"))
+        self._accumulated_earnings_feed = _safe_float(data.get("accumulated_earnings_feed"))
 
-        self._tracked_grid_import_kwh = safe_float(data.get("tracked_grid_import_kwh"))
-        self._total_grid_import_cost = safe_float(data.get("total_grid_import_cost"))
+        self._tracked_grid_import_kwh = _safe_float(data.get("tracked_grid_import_kwh"))
+        self._total_grid_import_cost = _safe_float(data.get("total_grid_import_cost"))
 
         today = date.today()
 
@@ -633,8 +664,8 @@ class PVManagementFixController:
             try:
                 daily_reset_date = date.fromisoformat(daily_reset_str)
                 if daily_reset_date == today:
-                    self._daily_grid_import_kwh = safe_float(data.get("daily_grid_import_kwh"))
-                    self._daily_grid_import_cost = safe_float(data.get("daily_grid_import_cost"))
+                    self._daily_grid_import_kwh = _safe_float(data.get("daily_grid_import_kwh"))
+                    self._daily_grid_import_cost = _safe_float(data.get("daily_grid_import_cost"))
             except (ValueError, TypeError):
                 pass
 
@@ -644,8 +675,8 @@ class PVManagementFixController:
         if monthly_reset_month is not None and monthly_reset_year is not None:
             try:
                 if int(monthly_reset_month) == today.month and int(monthly_reset_year) == today.year:
-                    self._monthly_grid_import_kwh = safe_float(data.get("monthly_grid_import_kwh"))
-                    self._monthly_grid_import_cost = safe_float(data.get("monthly_grid_import_cost"))
+                    self._monthly_grid_import_kwh = _safe_float(data.get("monthly_grid_import_kwh"))
+                    self._monthly_grid_import_cost = _safe_float(data.get("monthly_grid_import_cost"))
             except (ValueError, TypeError):
                 pass
 
@@ -660,6 +691,7 @@ class PVManagementFixController:
                 pass
 
         self._restored = True
+        self.update_id += 1
         _LOGGER.info(
             "PV Management Fixpreis restored: %.2f kWh self, %.2f kWh feed, %.2f€ savings",
             self._total_self_consumption_kwh,
@@ -669,9 +701,9 @@ class PVManagementFixController:
 
         @callback
         def delayed_restore_notify(_now):
-            self._notify_entities()
+            # Werte haben sich seit dem Restore nicht geändert (update_id schon erhöht)
+            self._notify_entities(changed=False)
 
-        from homeassistant.helpers.event import async_call_later
         async_call_later(self.hass, 5.0, delayed_restore_notify)
 
     def _initialize_from_sensors(self) -> None:
@@ -845,24 +877,24 @@ class PVManagementFixController:
 
         changed = False
 
+        # Gleicher Wert (z.B. nur Attribute geändert) -> nichts zu tun
         if entity_id == self.pv_production_entity:
+            changed = value != self._pv_production_kwh
             self._pv_production_kwh = value
-            changed = True
         elif entity_id == self.grid_export_entity:
+            changed = value != self._grid_export_kwh
             self._grid_export_kwh = value
-            changed = True
         elif entity_id == self.grid_import_entity:
+            changed = value != self._grid_import_kwh
             self._grid_import_kwh = value
-            changed = True
         elif entity_id == self.consumption_entity:
             self._consumption_kwh = value
         elif entity_id == self.epex_price_entity:
             # EPEX Preis auto-detect: > 1 = wahrscheinlich ct/kWh
-            if value > 1.0:
-                self._epex_price = value / 100.0
-            else:
-                self._epex_price = value
-            self._notify_entities()
+            price = value / 100.0 if value > 1.0 else value
+            if price != self._epex_price:
+                self._epex_price = price
+                self._notify_entities()
 
         if changed:
             self._process_energy_update()
@@ -907,7 +939,6 @@ class PVManagementFixController:
                 _LOGGER.info("Keine restored Daten, initialisiere von Sensoren")
                 self._initialize_from_sensors()
 
-        from homeassistant.helpers.event import async_call_later
         async_call_later(self.hass, 60.0, delayed_init_check)
 
         @callback
@@ -925,7 +956,7 @@ class PVManagementFixController:
         for remove in self._remove_listeners:
             remove()
         self._remove_listeners.clear()
-        self._entity_listeners.clear()
+        self._notify_debouncer.async_cancel()
 
     def reset_grid_import_tracking(self) -> None:
         """Setzt das Strompreis-Tracking auf 0 zurück."""
@@ -5,24 +5,14 @@ import logging
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN, DATA_CTRL, CONF_NAME
+from .const import DOMAIN, DATA_CTRL, CONF_NAME, DEVICE_PRICES
+from .helpers import get_device_info, uid_name
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_prices_device_info(name: str) -> DeviceInfo:
-    """DeviceInfo für das Strompreise-Gerät."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, f"{name}_prices")},
-        name=f"{name} Strompreise",
-        manufacturer="Custom",
-        model="PV Management Fixpreis - Strompreise",
-        via_device=(DOMAIN, name),
-    )
-
-
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ):
@@ -45,12 +35,7 @@ class BaseButton(ButtonEntity):
         self._attr_name = f"{name} {key}"
         self._attr_unique_id = f"{DOMAIN}_{name}_{key}".lower().replace(" ", "_")
         self._attr_icon = icon
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, name)},
-            name=name,
-            manufacturer="Custom",
-            model="PV Management Fixpreis",
-        )
+        self._attr_device_info = get_device_info(name)
 
 
 class ResetButton(BaseButton):
@@ -93,10 +78,9 @@ class ResetGridImportButton(ButtonEntity):
     def __init__(self, ctrl, name: str):
         self.ctrl = ctrl
         self._attr_name = f"{name} Strompreis-Tracking zurücksetzen"
-        uid_name = "".join(c if c.isalnum() else "_" for c in name).lower()
-        self._attr_unique_id = f"{DOMAIN}_{uid_name}_reset_grid_import_button"
+        self._attr_unique_id = f"{DOMAIN}_{uid_name(name)}_reset_grid_import_button"
         self._attr_icon = "mdi:cash-remove"
-        self._attr_device_info = get_prices_device_info(name)
+        self._attr_device_info = get_device_info(name, DEVICE_PRICES)
 
     async def async_press(self) -> None:
         """Handle button press - setzt alle Strompreis-Werte zurück."""
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any, Final
+
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 
 from .const import (
     DOMAIN,
     CONF_NAME, CONF_PV_PRODUCTION_ENTITY, CONF_GRID_EXPORT_ENTITY,
     CONF_GRID_IMPORT_ENTITY, CONF_CONSUMPTION_ENTITY,
-    CONF_ELECTRICITY_PRICE, CONF_ELECTRICITY_PRICE_UNIT,
     CONF_FEED_IN_TARIFF, CONF_FEED_IN_TARIFF_ENTITY, CONF_FEED_IN_TARIFF_UNIT,
     CONF_INSTALLATION_COST, CONF_INSTALLATION_DATE,
     CONF_SAVINGS_OFFSET, CONF_FIXED_PRICE,
@@ -16,18 +19,157 @@ from .const import (
     CONF_EPEX_PRICE_ENTITY,
     CONF_QUOTA_ENABLED, CONF_QUOTA_YEARLY_KWH, CONF_QUOTA_START_DATE,
     CONF_QUOTA_START_METER, CONF_QUOTA_MONTHLY_RATE, CONF_QUOTA_SEASONAL,
-    DEFAULT_NAME, DEFAULT_ELECTRICITY_PRICE, DEFAULT_FEED_IN_TARIFF,
-    DEFAULT_INSTALLATION_COST, DEFAULT_SAVINGS_OFFSET, DEFAULT_FIXED_PRICE,
-    DEFAULT_ELECTRICITY_PRICE_UNIT, DEFAULT_FEED_IN_TARIFF_UNIT,
-    DEFAULT_ENERGY_OFFSET_SELF, DEFAULT_ENERGY_OFFSET_EXPORT,
-    DEFAULT_QUOTA_ENABLED, DEFAULT_QUOTA_YEARLY_KWH,
-    DEFAULT_QUOTA_START_METER, DEFAULT_QUOTA_MONTHLY_RATE,
-    DEFAULT_QUOTA_SEASONAL,
-    RANGE_COST, RANGE_OFFSET, RANGE_ENERGY_OFFSET,
+    DEFAULTS,
+    RANGE_PRICE_CENT, RANGE_COST, RANGE_OFFSET, RANGE_ENERGY_OFFSET,
     RANGE_QUOTA_KWH, RANGE_QUOTA_METER, RANGE_QUOTA_RATE,
     PRICE_UNIT_EUR, PRICE_UNIT_CENT,
 )
 
+# Alle Keys, die im Options Flow bearbeitet werden
+_KNOWN_KEYS: frozenset[str] = frozenset({
+    CONF_PV_PRODUCTION_ENTITY, CONF_GRID_EXPORT_ENTITY,
+    CONF_GRID_IMPORT_ENTITY, CONF_CONSUMPTION_ENTITY, CONF_EPEX_PRICE_ENTITY,
+    CONF_FIXED_PRICE, CONF_FEED_IN_TARIFF, CONF_FEED_IN_TARIFF_ENTITY, CONF_FEED_IN_TARIFF_UNIT,
+    CONF_INSTALLATION_COST, CONF_INSTALLATION_DATE,
+    CONF_SAVINGS_OFFSET, CONF_ENERGY_OFFSET_SELF, CONF_ENERGY_OFFSET_EXPORT,
+    CONF_QUOTA_ENABLED, CONF_QUOTA_YEARLY_KWH, CONF_QUOTA_START_DATE,
+    CONF_QUOTA_START_METER, CONF_QUOTA_MONTHLY_RATE, CONF_QUOTA_SEASONAL,
+})
+
+# Sensor-, Datums- und Ja/Nein-Auswahl - für alle Felder dieselbe Instanz
+_SENSOR_SELECTOR: Final = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
+_DATE_SELECTOR: Final = selector.DateSelector()
+_BOOL_SELECTOR: Final = selector.BooleanSelector()
+
+# Einheiten-Auswahl (€/ct) - identisch in Config und Options Flow
+_PRICE_UNIT_OPTIONS: Final[tuple[selector.SelectOptionDict, ...]] = (
+    selector.SelectOptionDict(value=PRICE_UNIT_EUR, label="Euro pro kWh"),
+    selector.SelectOptionDict(value=PRICE_UNIT_CENT, label="Cent pro kWh"),
+)
+_PRICE_UNIT_SELECTOR: Final = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=list(_PRICE_UNIT_OPTIONS),
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
+
+@lru_cache(maxsize=None)
+def _number_selector(
+    min_: float,
+    max_: float,
+    step: float,
+    unit: str | None = None,
+    mode: selector.NumberSelectorMode = selector.NumberSelectorMode.BOX,
+) -> selector.NumberSelector:
+    """Zahlen-Eingabefeld - eine Instanz pro (min, max, step, unit, mode)."""
+    config = selector.NumberSelectorConfig(min=min_, max=max_, step=step, mode=mode)
+    if unit is not None:
+        config["unit_of_measurement"] = unit
+    return selector.NumberSelector(config)
+
+
+# Feld-Spezifikation: (vol.Required/vol.Optional, Key, Default, Selektor)
+_FieldSpec = tuple[type[vol.Marker], str, Any, Any]
+
+
+def _build_schema(fields: tuple[_FieldSpec, ...], values: dict[str, Any]) -> vol.Schema:
+    """Baut ein Schema aus einer Feld-Tabelle, aktuelle Werte ersetzen die Modul-Defaults."""
+    # Typ gehört zum Cache-Key: 0, 0.0 und False sind sonst derselbe Eintrag
+    defaults = tuple(
+        (type(value), value)
+        for value in (values.get(key, default) for _marker_cls, key, default, _field in fields)
+    )
+    return _cached_schema(fields, defaults)
+
+
+@lru_cache(maxsize=32, typed=True)
+def _cached_schema(
+    fields: tuple[_FieldSpec, ...], defaults: tuple[tuple[type, Any], ...]
+) -> vol.Schema:
+    """Schema pro (Feld-Tabelle, typisierte Defaults) - unveränderte Formulare werden wiederverwendet."""
+    return vol.Schema(
+        {
+            marker(key, default=default): field
+            for (marker, key, _default, field), (_type, default) in zip(fields, defaults)
+        }
+    )
+
+
+# --- Formular-Felder: (Marker, Key, Modul-Default, Selektor) -------------------
+# vol.UNDEFINED = kein Default (Feld bleibt leer, solange nichts konfiguriert ist)
+
+# Gemeinsam für Config Flow und Options Flow
+_ENERGY_SENSOR_FIELDS: tuple[_FieldSpec, ...] = (
+    (vol.Required, CONF_PV_PRODUCTION_ENTITY, vol.UNDEFINED, _SENSOR_SELECTOR),
+    (vol.Optional, CONF_GRID_EXPORT_ENTITY, vol.UNDEFINED, _SENSOR_SELECTOR),
+    (vol.Optional, CONF_GRID_IMPORT_ENTITY, vol.UNDEFINED, _SENSOR_SELECTOR),
+    (vol.Optional, CONF_CONSUMPTION_ENTITY, vol.UNDEFINED, _SENSOR_SELECTOR),
+)
+
+_TARIFF_FIELDS: tuple[_FieldSpec, ...] = (
+    # Fixpreis (Haupteinstellung)
+    (vol.Required, CONF_FIXED_PRICE, DEFAULTS[CONF_FIXED_PRICE],
+     _number_selector(*RANGE_PRICE_CENT, unit="ct/kWh")),
+
+    # Einspeisevergütung
+    (vol.Required, CONF_FEED_IN_TARIFF_UNIT, DEFAULTS[CONF_FEED_IN_TARIFF_UNIT], _PRICE_UNIT_SELECTOR),
+    (vol.Required, CONF_FEED_IN_TARIFF, DEFAULTS[CONF_FEED_IN_TARIFF], _number_selector(0.0, 50.0, 0.001)),
+)
+
+_AMORTISATION_FIELDS: tuple[_FieldSpec, ...] = (
+    (vol.Required, CONF_INSTALLATION_COST, DEFAULTS[CONF_INSTALLATION_COST],
+     _number_selector(*RANGE_COST, unit="€")),
+    (vol.Optional, CONF_INSTALLATION_DATE, vol.UNDEFINED, _DATE_SELECTOR),
+)
+
+# Config Flow (Ersteinrichtung)
+_USER_FIELDS: tuple[_FieldSpec, ...] = (
+    ((vol.Required, CONF_NAME, DEFAULTS[CONF_NAME], str),)
+    + _ENERGY_SENSOR_FIELDS
+    + _TARIFF_FIELDS
+    + _AMORTISATION_FIELDS
+)
+
+# Ohne bestehende Werte - einmalig beim Import gebaut
+_USER_SCHEMA: Final = _build_schema(_USER_FIELDS, {})
+
+# Options Flow
+_SENSORS_FIELDS: tuple[_FieldSpec, ...] = _ENERGY_SENSOR_FIELDS + (
+    # EPEX Spot (optional, für Vergleich)
+    (vol.Optional, CONF_EPEX_PRICE_ENTITY, vol.UNDEFINED, _SENSOR_SELECTOR),
+)
+
+_PRICES_FIELDS: tuple[_FieldSpec, ...] = (
+    _TARIFF_FIELDS
+    + ((vol.Optional, CONF_FEED_IN_TARIFF_ENTITY, vol.UNDEFINED, _SENSOR_SELECTOR),)
+    + _AMORTISATION_FIELDS
+)
+
+_OFFSETS_FIELDS: tuple[_FieldSpec, ...] = (
+    # Ersparnis-Offset (für bereits amortisierten Betrag)
+    (vol.Optional, CONF_SAVINGS_OFFSET, DEFAULTS[CONF_SAVINGS_OFFSET],
+     _number_selector(*RANGE_OFFSET, unit="€")),
+
+    # Energie-Offsets (für historische Daten vor Tracking)
+    (vol.Optional, CONF_ENERGY_OFFSET_SELF, DEFAULTS[CONF_ENERGY_OFFSET_SELF],
+     _number_selector(*RANGE_ENERGY_OFFSET, unit="kWh")),
+    (vol.Optional, CONF_ENERGY_OFFSET_EXPORT, DEFAULTS[CONF_ENERGY_OFFSET_EXPORT],
+     _number_selector(*RANGE_ENERGY_OFFSET, unit="kWh")),
+)
+
+_QUOTA_FIELDS: tuple[_FieldSpec, ...] = (
+    (vol.Required, CONF_QUOTA_ENABLED, DEFAULTS[CONF_QUOTA_ENABLED], _BOOL_SELECTOR),
+    (vol.Required, CONF_QUOTA_YEARLY_KWH, DEFAULTS[CONF_QUOTA_YEARLY_KWH],
+     _number_selector(*RANGE_QUOTA_KWH, unit="kWh")),
+    (vol.Optional, CONF_QUOTA_START_DATE, vol.UNDEFINED, _DATE_SELECTOR),
+    (vol.Required, CONF_QUOTA_START_METER, DEFAULTS[CONF_QUOTA_START_METER],
+     _number_selector(*RANGE_QUOTA_METER, unit="kWh")),
+    (vol.Optional, CONF_QUOTA_MONTHLY_RATE, DEFAULTS[CONF_QUOTA_MONTHLY_RATE],
+     _number_selector(*RANGE_QUOTA_RATE, unit="€/Monat")),
+    (vol.Required, CONF_QUOTA_SEASONAL, DEFAULTS[CONF_QUOTA_SEASONAL], _BOOL_SELECTOR),
+)
+
 
 class PVManagementFixConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Config Flow für PV Management Fixpreis."""
@@ -38,70 +180,21 @@ class PVManagementFixConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Erster Schritt: Basis-Konfiguration."""
         if user_input is not None:
             return self.async_create_entry(title=user_input[CONF_NAME], data=user_input)
+        return self._show_user_form()
 
+    def _show_user_form(self):
+        """Zeigt das Formular für die Basis-Konfiguration."""
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
-
-                # === ENERGIE-SENSOREN ===
-                vol.Required(CONF_PV_PRODUCTION_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_GRID_EXPORT_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_GRID_IMPORT_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-                vol.Optional(CONF_CONSUMPTION_ENTITY): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain="sensor")
-                ),
-
-                # === FIXPREIS ===
-                vol.Required(CONF_FIXED_PRICE, default=DEFAULT_FIXED_PRICE):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1.0, max=100.0, step=0.01,
-                            unit_of_measurement="ct/kWh",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-
-                # === EINSPEISEVERGÜTUNG ===
-                vol.Required(CONF_FEED_IN_TARIFF_UNIT, default=DEFAULT_FEED_IN_TARIFF_UNIT):
-                    selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(value=PRICE_UNIT_EUR, label="Euro pro kWh"),
-                                selector.SelectOptionDict(value=PRICE_UNIT_CENT, label="Cent pro kWh"),
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                vol.Required(CONF_FEED_IN_TARIFF, default=DEFAULT_FEED_IN_TARIFF):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0.0, max=50.0, step=0.001,
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-
-                # === AMORTISATION ===
-                vol.Required(CONF_INSTALLATION_COST, default=DEFAULT_INSTALLATION_COST):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=RANGE_COST["min"], max=RANGE_COST["max"], step=RANGE_COST["step"],
-                            unit_of_measurement="€",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                vol.Optional(CONF_INSTALLATION_DATE): selector.DateSelector(),
-            })
+            data_schema=_USER_SCHEMA,
         )
 
     @staticmethod
-    def async_get_options_flow(config_entry):
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> PVManagementFixOptionsFlow:
+        """Options Flow - pro Dialog eine eigene Instanz (hält die Eingaben)."""
         return PVManagementFixOptionsFlow()
 
 
@@ -111,18 +204,22 @@ class PVManagementFixOptionsFlow(config_entries.OptionsFlow):
     def __init__(self):
         self._data = {}
 
-    def _get_val(self, key, default=None):
-        """Holt aktuellen Wert aus Options oder Data."""
-        if key in self._data:
-            return self._data[key]
-        if key in self.config_entry.options:
-            return self.config_entry.options[key]
-        if key in self.config_entry.data:
-            return self.config_entry.data[key]
-        return default
+    def _current_values(self) -> dict[str, Any]:
+        """Aktuelle Werte in einem Durchlauf: Data < Options < bereits geänderte Werte."""
+        entry = self.config_entry
+        values: dict[str, Any] = {}
+        for source in (entry.data, entry.options, self._data):
+            for key, value in source.items():
+                if key in _KNOWN_KEYS:
+                    values[key] = value
+        return values
 
     async def async_step_init(self, user_input=None):
         """Hauptmenü mit Kategorien."""
+        return self._show_menu()
+
+    def _show_menu(self):
+        """Zeigt das Hauptmenü."""
         return self.async_show_menu(
             step_id="init",
             menu_options={
@@ -134,166 +231,46 @@ class PVManagementFixOptionsFlow(config_entries.OptionsFlow):
             },
         )
 
-    async def _save_and_return_to_menu(self, user_input):
-        """Speichert die Options und zeigt das Menü wieder an."""
+    def _save_and_return_to_menu(self, user_input):
+        """Merkt sich die Eingaben und zeigt das Menü wieder an.
+
+        Geschrieben wird erst bei "Speichern & Schließen"; wird der Dialog
+        vorher geschlossen, verfallen die Änderungen mit der Flow-Instanz.
+        """
         self._data.update(user_input)
-        final_data = {}
-        final_data.update(self.config_entry.options)
-        final_data.update(self._data)
-        self.hass.config_entries.async_update_entry(self.config_entry, options=final_data)
-        return await self.async_step_init()
+        return self._show_menu()
+
+    def _show_options_form(self, step_id: str, fields: tuple[_FieldSpec, ...]):
+        """Zeigt ein Options-Formular mit den aktuellen Werten als Defaults."""
+        return self.async_show_form(
+            step_id=step_id,
+            data_schema=_build_schema(fields, self._current_values()),
+        )
 
     async def async_step_sensors(self, user_input=None):
         """Energie-Sensoren konfigurieren."""
         if user_input is not None:
-            return await self._save_and_return_to_menu(user_input)
-
-        return self.async_show_form(
-            step_id="sensors",
-            data_schema=vol.Schema({
-                vol.Required(CONF_PV_PRODUCTION_ENTITY, default=self._get_val(CONF_PV_PRODUCTION_ENTITY)):
-                    selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
-                vol.Optional(CONF_GRID_EXPORT_ENTITY, default=self._get_val(CONF_GRID_EXPORT_ENTITY)):
-                    selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
-                vol.Optional(CONF_GRID_IMPORT_ENTITY, default=self._get_val(CONF_GRID_IMPORT_ENTITY)):
-                    selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
-                vol.Optional(CONF_CONSUMPTION_ENTITY, default=self._get_val(CONF_CONSUMPTION_ENTITY)):
-                    selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
-
-                # EPEX Spot (optional, für Vergleich)
-                vol.Optional(CONF_EPEX_PRICE_ENTITY, default=self._get_val(CONF_EPEX_PRICE_ENTITY)):
-                    selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
-            })
-        )
+            return self._save_and_return_to_menu(user_input)
+        return self._show_options_form("sensors", _SENSORS_FIELDS)
 
     async def async_step_prices(self, user_input=None):
         """Strompreise und Amortisation konfigurieren."""
         if user_input is not None:
-            return await self._save_and_return_to_menu(user_input)
-
-        return self.async_show_form(
-            step_id="prices",
-            data_schema=vol.Schema({
-                # Fixpreis (Haupteinstellung)
-                vol.Required(CONF_FIXED_PRICE, default=self._get_val(CONF_FIXED_PRICE, DEFAULT_FIXED_PRICE)):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=1.0, max=100.0, step=0.01,
-                            unit_of_measurement="ct/kWh",
-                            mode=selector.NumberSelectorMode.BOX
-                        )
-                    ),
-
-                # Einspeisevergütung
-                vol.Required(CONF_FEED_IN_TARIFF_UNIT, default=self._get_val(CONF_FEED_IN_TARIFF_UNIT, DEFAULT_FEED_IN_TARIFF_UNIT)):
-                    selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                selector.SelectOptionDict(value=PRICE_UNIT_EUR, label="Euro pro kWh"),
-                                selector.SelectOptionDict(value=PRICE_UNIT_CENT, label="Cent pro kWh"),
-                            ],
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                vol.Required(CONF_FEED_IN_TARIFF, default=self._get_val(CONF_FEED_IN_TARIFF, DEFAULT_FEED_IN_TARIFF)):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=0.0, max=50.0, step=0.001, mode=selector.NumberSelectorMode.BOX)
-                    ),
-                vol.Optional(CONF_FEED_IN_TARIFF_ENTITY, default=self._get_val(CONF_FEED_IN_TARIFF_ENTITY)):
-                    selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
-
-                # Amortisation
-                vol.Required(CONF_INSTALLATION_COST, default=self._get_val(CONF_INSTALLATION_COST, DEFAULT_INSTALLATION_COST)):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=RANGE_COST["min"], max=RANGE_COST["max"], step=RANGE_COST["step"],
-                            unit_of_measurement="€", mode=selector.NumberSelectorMode.BOX
-                        )
-                    ),
-                vol.Optional(CONF_INSTALLATION_DATE, default=self._get_val(CONF_INSTALLATION_DATE)):
-                    selector.DateSelector(),
-            })
-        )
+            return self._save_and_return_to_menu(user_input)
+        return self._show_options_form("prices", _PRICES_FIELDS)
 
     async def async_step_offsets(self, user_input=None):
         """Historische Daten (Offsets) konfigurieren."""
         if user_input is not None:
-            return await self._save_and_return_to_menu(user_input)
-
-        return self.async_show_form(
-            step_id="offsets",
-            data_schema=vol.Schema({
-                # Ersparnis-Offset (für bereits amortisierten Betrag)
-                vol.Optional(CONF_SAVINGS_OFFSET, default=self._get_val(CONF_SAVINGS_OFFSET, DEFAULT_SAVINGS_OFFSET)):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=RANGE_OFFSET["min"], max=RANGE_OFFSET["max"], step=RANGE_OFFSET["step"],
-                            unit_of_measurement="€", mode=selector.NumberSelectorMode.BOX
-                        )
-                    ),
-
-                # Energie-Offsets (für historische Daten vor Tracking)
-                vol.Optional(CONF_ENERGY_OFFSET_SELF, default=self._get_val(CONF_ENERGY_OFFSET_SELF, DEFAULT_ENERGY_OFFSET_SELF)):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=RANGE_ENERGY_OFFSET["min"], max=RANGE_ENERGY_OFFSET["max"], step=RANGE_ENERGY_OFFSET["step"],
-                            unit_of_measurement="kWh", mode=selector.NumberSelectorMode.BOX
-                        )
-                    ),
-                vol.Optional(CONF_ENERGY_OFFSET_EXPORT, default=self._get_val(CONF_ENERGY_OFFSET_EXPORT, DEFAULT_ENERGY_OFFSET_EXPORT)):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=RANGE_ENERGY_OFFSET["min"], max=RANGE_ENERGY_OFFSET["max"], step=RANGE_ENERGY_OFFSET["step"],
-                            unit_of_measurement="kWh", mode=selector.NumberSelectorMode.BOX
-                        )
-                    ),
-            })
-        )
+            return self._save_and_return_to_menu(user_input)
+        return self._show_options_form("offsets", _OFFSETS_FIELDS)
 
     async def async_step_quota(self, user_input=None):
         """Stromkontingent konfigurieren."""
         if user_input is not None:
-            return await self._save_and_return_to_menu(user_input)
-
-        return self.async_show_form(
-            step_id="quota",
-            data_schema=vol.Schema({
-                vol.Required(CONF_QUOTA_ENABLED, default=self._get_val(CONF_QUOTA_ENABLED, DEFAULT_QUOTA_ENABLED)):
-                    selector.BooleanSelector(),
-                vol.Required(CONF_QUOTA_YEARLY_KWH, default=self._get_val(CONF_QUOTA_YEARLY_KWH, DEFAULT_QUOTA_YEARLY_KWH)):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=RANGE_QUOTA_KWH["min"], max=RANGE_QUOTA_KWH["max"], step=RANGE_QUOTA_KWH["step"],
-                            unit_of_measurement="kWh",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                vol.Optional(CONF_QUOTA_START_DATE, default=self._get_val(CONF_QUOTA_START_DATE)):
-                    selector.DateSelector(),
-                vol.Required(CONF_QUOTA_START_METER, default=self._get_val(CONF_QUOTA_START_METER, DEFAULT_QUOTA_START_METER)):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=RANGE_QUOTA_METER["min"], max=RANGE_QUOTA_METER["max"], step=RANGE_QUOTA_METER["step"],
-                            unit_of_measurement="kWh",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                vol.Optional(CONF_QUOTA_MONTHLY_RATE, default=self._get_val(CONF_QUOTA_MONTHLY_RATE, DEFAULT_QUOTA_MONTHLY_RATE)):
-                    selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=RANGE_QUOTA_RATE["min"], max=RANGE_QUOTA_RATE["max"], step=RANGE_QUOTA_RATE["step"],
-                            unit_of_measurement="€/Monat",
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
-                vol.Required(CONF_QUOTA_SEASONAL, default=self._get_val(CONF_QUOTA_SEASONAL, DEFAULT_QUOTA_SEASONAL)):
-                    selector.BooleanSelector(),
-            })
-        )
+            return self._save_and_return_to_menu(user_input)
+        return self._show_options_form("quota", _QUOTA_FIELDS)
 
     async def async_step_save(self, user_input=None):
         """Speichert alle Änderungen."""
-        final_data = {}
-        final_data.update(self.config_entry.options)
-        final_data.update(self._data)
-        return self.async_create_entry(title="", data=final_data)
+        return self.async_create_entry(title="", data=self.config_entry.options | self._data)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Final
+from types import MappingProxyType
+from typing import Any, Final, Mapping, NamedTuple
 from homeassistant.const import Platform
 
 # --- Domain / Platforms -------------------------------------------------------
@@ -13,6 +14,11 @@ PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.BUTTON,
 )
 
+# --- Geräte-Typen (Sensoren und Buttons) -------------------------------------
+DEVICE_MAIN: Final[str] = "main"
+DEVICE_PRICES: Final[str] = "prices"
+DEVICE_QUOTA: Final[str] = "quota"
+
 # --- Config keys (Setup) ------------------------------------------------------
 CONF_NAME: Final[str] = "name"
 CONF_PV_PRODUCTION_ENTITY: Final[str] = "pv_production_entity"
@@ -72,9 +78,28 @@ DEFAULT_QUOTA_START_METER: Final[float] = 0.0  # Zählerstand bei Start
 DEFAULT_QUOTA_MONTHLY_RATE: Final[float] = 0.0  # €/Monat Abschlag
 DEFAULT_QUOTA_SEASONAL: Final[bool] = True
 
+# Alle Defaults nach Config-Key (für Formulare)
+DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType({
+    CONF_NAME: DEFAULT_NAME,
+    CONF_ELECTRICITY_PRICE: DEFAULT_ELECTRICITY_PRICE,
+    CONF_ELECTRICITY_PRICE_UNIT: DEFAULT_ELECTRICITY_PRICE_UNIT,
+    CONF_FEED_IN_TARIFF: DEFAULT_FEED_IN_TARIFF,
+    CONF_FEED_IN_TARIFF_UNIT: DEFAULT_FEED_IN_TARIFF_UNIT,
+    CONF_INSTALLATION_COST: DEFAULT_INSTALLATION_COST,
+    CONF_SAVINGS_OFFSET: DEFAULT_SAVINGS_OFFSET,
+    CONF_ENERGY_OFFSET_SELF: DEFAULT_ENERGY_OFFSET_SELF,
+    CONF_ENERGY_OFFSET_EXPORT: DEFAULT_ENERGY_OFFSET_EXPORT,
+    CONF_FIXED_PRICE: DEFAULT_FIXED_PRICE,
+    CONF_QUOTA_ENABLED: DEFAULT_QUOTA_ENABLED,
+    CONF_QUOTA_YEARLY_KWH: DEFAULT_QUOTA_YEARLY_KWH,
+    CONF_QUOTA_START_METER: DEFAULT_QUOTA_START_METER,
+    CONF_QUOTA_MONTHLY_RATE: DEFAULT_QUOTA_MONTHLY_RATE,
+    CONF_QUOTA_SEASONAL: DEFAULT_QUOTA_SEASONAL,
+})
+
 # Saisonale Gewichtungsfaktoren (deutscher Wohnstrom-Durchschnitt)
 # Normalisiert auf Summe = 12 (Faktor 1.0 = Durchschnitt)
-SEASONAL_FACTORS: Final[dict[int, float]] = {
+SEASONAL_FACTORS: Final[Mapping[int, float]] = MappingProxyType({
     1: 1.20,   # Januar
     2: 1.15,   # Februar
     3: 1.05,   # März
@@ -87,18 +112,26 @@ SEASONAL_FACTORS: Final[dict[int, float]] = {
     10: 1.00,  # Oktober
     11: 1.15,  # November
     12: 1.45,  # Dezember
-}
+})
 
 # --- Ranges für Config Flow / Options -----------------------------------------
-RANGE_PRICE_EUR: Final[dict] = {"min": 0.01, "max": 1.0, "step": 0.001}
-RANGE_PRICE_CENT: Final[dict] = {"min": 1.0, "max": 100.0, "step": 0.01}
-RANGE_TARIFF_EUR: Final[dict] = {"min": 0.0, "max": 0.5, "step": 0.001}
-RANGE_TARIFF_CENT: Final[dict] = {"min": 0.0, "max": 50.0, "step": 0.01}
-RANGE_COST: Final[dict] = {"min": 0.0, "max": 200000.0, "step": 1.0}
-RANGE_OFFSET: Final[dict] = {"min": 0.0, "max": 100000.0, "step": 0.01}
-RANGE_ENERGY_OFFSET: Final[dict] = {"min": 0.0, "max": 500000.0, "step": 0.01}
+class _Range(NamedTuple):
+    """Wertebereich eines Zahlenfelds (min, max, step)."""
+
+    min: float
+    max: float
+    step: float
+
+
+RANGE_PRICE_EUR: Final[_Range] = _Range(min=0.01, max=1.0, step=0.001)
+RANGE_PRICE_CENT: Final[_Range] = _Range(min=1.0, max=100.0, step=0.01)
+RANGE_TARIFF_EUR: Final[_Range] = _Range(min=0.0, max=0.5, step=0.001)
+RANGE_TARIFF_CENT: Final[_Range] = _Range(min=0.0, max=50.0, step=0.01)
+RANGE_COST: Final[_Range] = _Range(min=0.0, max=200000.0, step=1.0)
+RANGE_OFFSET: Final[_Range] = _Range(min=0.0, max=100000.0, step=0.01)
+RANGE_ENERGY_OFFSET: Final[_Range] = _Range(min=0.0, max=500000.0, step=0.01)
 
 # Stromkontingent Ranges
-RANGE_QUOTA_KWH: Final[dict] = {"min": 100.0, "max": 100000.0, "step": 1.0}
-RANGE_QUOTA_METER: Final[dict] = {"min": 0.0, "max": 9999999.0, "step": 0.01}
-RANGE_QUOTA_RATE: Final[dict] = {"min": 0.0, "max": 10000.0, "step": 0.01}
+RANGE_QUOTA_KWH: Final[_Range] = _Range(min=100.0, max=100000.0, step=1.0)
+RANGE_QUOTA_METER: Final[_Range] = _Range(min=0.0, max=9999999.0, step=0.01)
+RANGE_QUOTA_RATE: Final[_Range] = _Range(min=0.0, max=10000.0, step=0.01)
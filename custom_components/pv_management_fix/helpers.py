@@ -0,0 +1,86 @@
+"""Gemeinsame Helfer für die Sensor- und Button-Plattform."""
+from __future__ import annotations
+
+from functools import lru_cache, wraps
+from typing import Any, Callable
+
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN, DEVICE_MAIN, DEVICE_PRICES, DEVICE_QUOTA
+
+
+def tick_cached_by(
+    update_id_of: Callable[[Any], int],
+) -> Callable[[Callable[[Any], Any]], property]:
+    """Decorator-Fabrik: Property, die pro update_id nur einmal berechnet wird.
+
+    update_id_of liefert den aktuellen Controller-Stand, der Wert liegt
+    in self._tick_cache als (update_id, Wert).
+    """
+
+    def decorator(func: Callable[[Any], Any]) -> property:
+        key = func.__name__
+
+        @wraps(func)
+        def getter(self):
+            update_id = update_id_of(self)
+            cached = self._tick_cache.get(key)
+            if cached is not None and cached[0] == update_id:
+                return cached[1]
+            value = func(self)
+            self._tick_cache[key] = (update_id, value)
+            return value
+
+        return property(getter)
+
+    return decorator
+
+
+class _UidTable(dict):
+    """translate-Tabelle: alphanumerisch bleibt, sonst "_" (füllt sich bei Bedarf)."""
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        value = char if char.isalnum() else "_"
+        self[codepoint] = value
+        return value
+
+
+_UID_TABLE = _UidTable()
+
+
+@lru_cache(maxsize=32)
+def uid_name(name: str) -> str:
+    """Name als unique_id-Bestandteil (Sonderzeichen -> "_") - einmal pro Name."""
+    return name.translate(_UID_TABLE).lower()
+
+
+def get_device_info(name: str, device_type: str = DEVICE_MAIN) -> DeviceInfo:
+    """Erstellt DeviceInfo für verschiedene Geräte-Typen.
+
+    Bewusst nicht gecacht: DeviceInfo ist ein veränderbares dict, jede
+    Entity bekommt ihre eigene Instanz.
+    """
+    if device_type == DEVICE_PRICES:
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{name}_prices")},
+            name=f"{name} Strompreise",
+            manufacturer="Custom",
+            model="PV Management Fixpreis - Strompreise",
+            via_device=(DOMAIN, name),
+        )
+    elif device_type == DEVICE_QUOTA:
+        return DeviceInfo(
+            identifiers={(DOMAIN, f"{name}_quota")},
+            name=f"{name} Stromkontingent",
+            manufacturer="Custom",
+            model="PV Management Fixpreis - Stromkontingent",
+            via_device=(DOMAIN, name),
+        )
+    else:  # DEVICE_MAIN
+        return DeviceInfo(
+            identifiers={(DOMAIN, name)},
+            name=name,
+            manufacturer="Custom",
+            model="PV Management Fixpreis",
+        )
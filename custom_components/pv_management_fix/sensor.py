@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
 from datetime import date
-from typing import Any
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -11,44 +15,19 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN, DATA_CTRL, CONF_NAME
+from .const import DOMAIN, DATA_CTRL, CONF_NAME, DEVICE_MAIN, DEVICE_PRICES, DEVICE_QUOTA
+from .helpers import get_device_info, tick_cached_by, uid_name
 
 _LOGGER = logging.getLogger(__name__)
 
-# Geräte-Typen
-DEVICE_MAIN = "main"
-DEVICE_PRICES = "prices"
-DEVICE_QUOTA = "quota"
-
-
-def get_device_info(name: str, device_type: str = DEVICE_MAIN) -> DeviceInfo:
-    """Erstellt DeviceInfo für verschiedene Geräte-Typen."""
-    if device_type == DEVICE_PRICES:
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{name}_prices")},
-            name=f"{name} Strompreise",
-            manufacturer="Custom",
-            model="PV Management Fixpreis - Strompreise",
-            via_device=(DOMAIN, name),
-        )
-    elif device_type == DEVICE_QUOTA:
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{name}_quota")},
-            name=f"{name} Stromkontingent",
-            manufacturer="Custom",
-            model="PV Management Fixpreis - Stromkontingent",
-            via_device=(DOMAIN, name),
-        )
-    else:  # DEVICE_MAIN
-        return DeviceInfo(
-            identifiers={(DOMAIN, name)},
-            name=name,
-            manufacturer="Custom",
-            model="PV Management Fixpreis",
-        )
+
+# Entity-Property, die pro Controller-Stand (update_id) nur einmal berechnet wird -
+# für Werte, die sich nur mit einem Controller-Update ändern müssen.
+tick_cached = tick_cached_by(attrgetter("ctrl.update_id"))
 
 
 async def async_setup_entry(
@@ -58,6 +37,9 @@ async def async_setup_entry(
     ctrl = hass.data[DOMAIN][entry.entry_id][DATA_CTRL]
     name = entry.data.get(CONF_NAME, "PV Fixpreis")
 
+    def simple(specs: tuple[SensorSpec, ...]) -> list[SimpleSensor]:
+        return [SimpleSensor(ctrl, name, spec) for spec in specs]
+
     entities = [
         # === AMORTISATION (Hauptzweck) ===
         AmortisationPercentSensor(ctrl, name),
@@ -68,29 +50,20 @@ async def async_setup_entry(
         EstimatedRemainingDaysSensor(ctrl, name),
 
         # === ENERGIE ===
-        SelfConsumptionSensor(ctrl, name),
-        FeedInSensor(ctrl, name),
-        SelfConsumptionRatioSensor(ctrl, name),
-        AutarkyRateSensor(ctrl, name),
+        *simple(ENERGY_SENSORS),
 
         # === FINANZEN ===
         SavingsSelfConsumptionSensor(ctrl, name),
         EarningsFeedInSensor(ctrl, name),
 
         # === STATISTIK ===
-        AverageDailySavingsSensor(ctrl, name),
-        AverageMonthlySavingsSensor(ctrl, name),
-        AverageYearlySavingsSensor(ctrl, name),
-        DaysSinceInstallationSensor(ctrl, name),
+        *simple(STATISTIC_SENSORS),
 
         # === UMWELT ===
         CO2SavedSensor(ctrl, name),
 
         # === DIAGNOSE ===
-        FixedPriceSensor(ctrl, name),
-        CurrentFeedInTariffSensor(ctrl, name),
-        PVProductionSensor(ctrl, name),
-        InstallationCostSensor(ctrl, name),
+        *simple(DIAGNOSTIC_SENSORS),
         ConfigurationDiagnosticSensor(ctrl, name, entry),
 
         # === STROMPREIS-VERGLEICH (Spot vs Fixpreis) ===
@@ -102,20 +75,23 @@ async def async_setup_entry(
     if ctrl.quota_enabled:
         entities.extend([
             QuotaRemainingSensor(ctrl, name),
-            QuotaConsumedPercentSensor(ctrl, name),
+            *simple(QUOTA_SENSORS),
             QuotaReserveSensor(ctrl, name),
-            QuotaDailyBudgetSensor(ctrl, name),
             QuotaForecastSensor(ctrl, name),
             QuotaDaysRemainingSensor(ctrl, name),
             QuotaStatusSensor(ctrl, name),
         ])
 
-    async_add_entities(entities)
+    # Werte kommen vom Controller - kein async_update() vor dem Hinzufügen
+    async_add_entities(entities, update_before_add=False)
 
 
 class BaseEntity(SensorEntity):
     """Basis-Klasse für alle Sensoren."""
 
+    # Eigene Felder als Slots - HA-Attribute (_attr_*, hass, ...) bleiben im __dict__
+    __slots__ = ("ctrl", "_base_name", "_last_update_id", "_tick_cache")
+
     _attr_should_poll = False
 
     def __init__(
@@ -133,28 +109,157 @@ class BaseEntity(SensorEntity):
         self.ctrl = ctrl
         self._base_name = name
         self._attr_name = f"{name} {key}"
-        uid_name = "".join(c if c.isalnum() else "_" for c in name).lower()
-        self._attr_unique_id = f"{DOMAIN}_{uid_name}_{key.lower().replace(' ', '_')}"
+        self._attr_unique_id = f"{DOMAIN}_{uid_name(name)}_{key.lower().replace(' ', '_')}"
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
         self._attr_state_class = state_class
         self._attr_device_class = device_class
         self._attr_entity_category = entity_category
         self._attr_device_info = get_device_info(name, device_type)
-        self._removed = False
+        self._last_update_id = -1
+        self._tick_cache: dict[str, tuple[int, Any]] = {}
 
     async def async_added_to_hass(self):
-        self._removed = False
-        self.ctrl.register_entity_listener(self._on_ctrl_update)
-
-    async def async_will_remove_from_hass(self):
-        self._removed = True
-        self.ctrl.unregister_entity_listener(self._on_ctrl_update)
+        # HA schreibt den State direkt nach dem Hinzufügen mit den aktuellen Werten
+        self._last_update_id = self.ctrl.update_id
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, self.ctrl.signal_update, self._on_ctrl_update)
+        )
 
     @callback
     def _on_ctrl_update(self):
-        if not self._removed and self.hass:
-            self.async_write_ha_state()
+        # Kein neuer Stand seit dem letzten Schreiben -> überspringen
+        update_id = self.ctrl.update_id
+        if update_id == self._last_update_id:
+            return
+        self._last_update_id = update_id
+        self.async_write_ha_state()
+
+
+# =============================================================================
+# EINFACHE SENSOREN (Wert = Controller-Attribut)
+# =============================================================================
+
+
+class SensorSpec(NamedTuple):
+    """Beschreibung eines Sensors ohne eigene Logik."""
+
+    key: str
+    value_attr: str  # Property/Attribut am Controller
+    digits: int | None  # Nachkommastellen (None = nicht runden)
+    unit: str | None = None
+    icon: str | None = None
+    state_class: SensorStateClass | None = None
+    device_class: SensorDeviceClass | None = None
+    entity_category: EntityCategory | None = None
+    device_type: str = DEVICE_MAIN
+
+
+ENERGY_SENSORS: tuple[SensorSpec, ...] = (
+    SensorSpec(
+        "Eigenverbrauch", "self_consumption_kwh", 2,
+        unit="kWh", icon="mdi:home-lightning-bolt",
+        state_class=SensorStateClass.TOTAL_INCREASING, device_class=SensorDeviceClass.ENERGY,
+    ),
+    SensorSpec(
+        "Einspeisung", "feed_in_kwh", 2,
+        unit="kWh", icon="mdi:transmission-tower-export",
+        state_class=SensorStateClass.TOTAL_INCREASING, device_class=SensorDeviceClass.ENERGY,
+    ),
+    SensorSpec(
+        "Eigenverbrauchsquote", "self_consumption_ratio", 1,
+        unit="%", icon="mdi:home-percent", state_class=SensorStateClass.MEASUREMENT,
+    ),
+    # Autarkiegrad - None wenn nicht berechenbar
+    SensorSpec(
+        "Autarkiegrad", "autarky_rate", 1,
+        unit="%", icon="mdi:home-battery", state_class=SensorStateClass.MEASUREMENT,
+    ),
+)
+
+STATISTIC_SENSORS: tuple[SensorSpec, ...] = (
+    SensorSpec(
+        "Ersparnis pro Tag", "average_daily_savings", 2,
+        unit="€/Tag", icon="mdi:calendar-today", state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        "Ersparnis pro Monat", "average_monthly_savings", 2,
+        unit="€/Monat", icon="mdi:calendar-month", state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        "Ersparnis pro Jahr", "average_yearly_savings", 2,
+        unit="€/Jahr", icon="mdi:calendar", state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorSpec(
+        "Tage seit Installation", "days_since_installation", None,
+        unit="Tage", icon="mdi:calendar-clock", state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+)
+
+DIAGNOSTIC_SENSORS: tuple[SensorSpec, ...] = (
+    SensorSpec(
+        "Fixpreis", "fixed_price_ct", 2,
+        unit="ct/kWh", icon="mdi:currency-eur", state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorSpec(
+        "Einspeisevergütung", "current_feed_in_tariff", 4,
+        unit="€/kWh", icon="mdi:currency-eur", state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorSpec(
+        "PV Produktion", "pv_production_kwh", 2,
+        unit="kWh", icon="mdi:solar-power",
+        state_class=SensorStateClass.TOTAL_INCREASING, device_class=SensorDeviceClass.ENERGY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorSpec(
+        "Anschaffungskosten", "installation_cost", 2,
+        unit="€", icon="mdi:cash", device_class=SensorDeviceClass.MONETARY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+QUOTA_SENSORS: tuple[SensorSpec, ...] = (
+    SensorSpec(
+        "Kontingent Verbrauch", "quota_consumed_percent", 1,
+        unit="%", icon="mdi:gauge", state_class=SensorStateClass.MEASUREMENT,
+        device_type=DEVICE_QUOTA,
+    ),
+    # Tagesbudget - None wenn Periode abgelaufen
+    SensorSpec(
+        "Kontingent Tagesbudget", "quota_daily_budget_kwh", 1,
+        unit="kWh/Tag", icon="mdi:calendar-today", state_class=SensorStateClass.MEASUREMENT,
+        device_type=DEVICE_QUOTA,
+    ),
+)
+
+
+class SimpleSensor(BaseEntity):
+    """Sensor, dessen Wert direkt aus dem Controller kommt (siehe SensorSpec)."""
+
+    __slots__ = ("_spec",)
+
+    def __init__(self, ctrl, name: str, spec: SensorSpec):
+        super().__init__(
+            ctrl,
+            name,
+            spec.key,
+            unit=spec.unit,
+            icon=spec.icon,
+            state_class=spec.state_class,
+            device_class=spec.device_class,
+            entity_category=spec.entity_category,
+            device_type=spec.device_type,
+        )
+        self._spec = spec
+
+    @property
+    def native_value(self):
+        value = getattr(self.ctrl, self._spec.value_attr)
+        if value is None or self._spec.digits is None:
+            return value
+        return round(value, self._spec.digits)
 
 
 # =============================================================================
@@ -179,16 +284,29 @@ class AmortisationPercentSensor(BaseEntity):
     def native_value(self) -> float:
         return round(self.ctrl.amortisation_percent, 2)
 
-    @property
+    @tick_cached
     def extra_state_attributes(self):
+        ctrl = self.ctrl
         return {
-            "total_savings": f"{self.ctrl.total_savings:.2f}€",
-            "installation_cost": f"{self.ctrl.installation_cost:.2f}€",
-            "remaining": f"{self.ctrl.remaining_cost:.2f}€",
-            "is_amortised": self.ctrl.is_amortised,
+            "total_savings": f"{ctrl.total_savings:.2f}€",
+            "installation_cost": f"{ctrl.installation_cost:.2f}€",
+            "remaining": f"{ctrl.remaining_cost:.2f}€",
+            "is_amortised": ctrl.is_amortised,
         }
 
 
+# Restore: Attribut im letzten State -> Key für ctrl.restore_state()
+_RESTORE_ATTRS: tuple[tuple[str, str], ...] = (
+    ("tracked_self_consumption_kwh", "total_self_consumption_kwh"),
+    ("tracked_feed_in_kwh", "total_feed_in_kwh"),
+    ("accumulated_savings_self", "accumulated_savings_self"),
+    ("accumulated_earnings_feed", "accumulated_earnings_feed"),
+    ("first_seen_date", "first_seen_date"),
+    ("tracked_grid_import_kwh", "tracked_grid_import_kwh"),
+    ("total_grid_import_cost", "total_grid_import_cost"),
+)
+
+
 class TotalSavingsSensor(BaseEntity, RestoreEntity):
     """Gesamtersparnis in Euro - persistiert Daten."""
 
@@ -209,48 +327,30 @@ class TotalSavingsSensor(BaseEntity, RestoreEntity):
         last_state = await self.async_get_last_state()
         if last_state and last_state.state not in ("unknown", "unavailable"):
             attrs = last_state.attributes or {}
-
-            def safe_float(val, default=0.0):
-                try:
-                    return float(val) if val is not None else default
-                except (ValueError, TypeError):
-                    return default
-
-            restore_data = {
-                "total_self_consumption_kwh": safe_float(attrs.get("tracked_self_consumption_kwh")),
-                "total_feed_in_kwh": safe_float(attrs.get("tracked_feed_in_kwh")),
-                "accumulated_savings_self": safe_float(attrs.get("accumulated_savings_self")),
-                "accumulated_earnings_feed": safe_float(attrs.get("accumulated_earnings_feed")),
-                "first_seen_date": attrs.get("first_seen_date"),
-                "tracked_grid_import_kwh": safe_float(attrs.get("tracked_grid_import_kwh")),
-                "total_grid_import_cost": safe_float(attrs.get("total_grid_import_cost")),
-            }
-
-            _LOGGER.info(
-                "TotalSavingsSensor: Restore data: self=%.2f kWh, feed=%.2f kWh",
-                restore_data["total_self_consumption_kwh"],
-                restore_data["total_feed_in_kwh"],
-            )
-
+            # Rohwerte - ctrl.restore_state() konvertiert (float/Datum) und loggt
+            restore_data = {key: attrs.get(attr) for attr, key in _RESTORE_ATTRS}
             self.ctrl.restore_state(restore_data)
-            self.async_write_ha_state()
+            # Kein eigenes Schreiben: HA schreibt den State direkt nach
+            # async_added_to_hass() - dann schon mit den wiederhergestellten Werten
+            self._last_update_id = self.ctrl.update_id
 
     @property
     def native_value(self) -> float:
         return round(self.ctrl.total_savings, 2)
 
-    @property
+    @tick_cached
     def extra_state_attributes(self) -> dict[str, Any]:
+        ctrl = self.ctrl
         return {
-            "savings_self_consumption": f"{self.ctrl.savings_self_consumption:.2f}€",
-            "earnings_feed_in": f"{self.ctrl.earnings_feed_in:.2f}€",
-            "tracked_self_consumption_kwh": round(self.ctrl._total_self_consumption_kwh, 4),
-            "tracked_feed_in_kwh": round(self.ctrl._total_feed_in_kwh, 4),
-            "accumulated_savings_self": round(self.ctrl._accumulated_savings_self, 4),
-            "accumulated_earnings_feed": round(self.ctrl._accumulated_earnings_feed, 4),
-            "first_seen_date": self.ctrl._first_seen_date.isoformat() if self.ctrl._first_seen_date else None,
-            "tracked_grid_import_kwh": round(self.ctrl._tracked_grid_import_kwh, 4),
-            "total_grid_import_cost": round(self.ctrl._total_grid_import_cost, 4),
+            "savings_self_consumption": f"{ctrl.savings_self_consumption:.2f}€",
+            "earnings_feed_in": f"{ctrl.earnings_feed_in:.2f}€",
+            "tracked_self_consumption_kwh": round(ctrl._total_self_consumption_kwh, 4),
+            "tracked_feed_in_kwh": round(ctrl._total_feed_in_kwh, 4),
+            "accumulated_savings_self": round(ctrl._accumulated_savings_self, 4),
+            "accumulated_earnings_feed": round(ctrl._accumulated_earnings_feed, 4),
+            "first_seen_date": ctrl._first_seen_date.isoformat() if ctrl._first_seen_date else None,
+            "tracked_grid_import_kwh": round(ctrl._tracked_grid_import_kwh, 4),
+            "total_grid_import_cost": round(ctrl._total_grid_import_cost, 4),
             "calculation_method": "incremental (fixed price)",
         }
 
@@ -280,6 +380,11 @@ class RemainingCostSensor(BaseEntity):
         return "mdi:cash-minus"
 
 
+# Status-Icon nach Amortisation: < 50% / ab 50% / ab 75%
+_STATUS_ICON_THRESHOLDS: tuple[float, ...] = (50.0, 75.0)
+_STATUS_ICONS: tuple[str, ...] = ("mdi:solar-panel", "mdi:solar-power-variant", "mdi:trending-up")
+
+
 class StatusSensor(BaseEntity):
     """Status-Text (z.B. '45.2% amortisiert' oder 'Amortisiert!')."""
 
@@ -297,91 +402,26 @@ class StatusSensor(BaseEntity):
 
     @property
     def icon(self) -> str:
-        if self.ctrl.is_amortised:
+        ctrl = self.ctrl
+        if ctrl.is_amortised:
             return "mdi:party-popper"
-        elif self.ctrl.amortisation_percent >= 75:
-            return "mdi:trending-up"
-        elif self.ctrl.amortisation_percent >= 50:
-            return "mdi:solar-power-variant"
-        else:
-            return "mdi:solar-panel"
+        return _STATUS_ICONS[bisect_right(_STATUS_ICON_THRESHOLDS, ctrl.amortisation_percent)]
 
-    @property
+    @tick_cached
     def extra_state_attributes(self):
+        ctrl = self.ctrl
+        total_savings = ctrl.total_savings
         attrs = {
-            "percent": f"{self.ctrl.amortisation_percent:.1f}%",
-            "total_savings": f"{self.ctrl.total_savings:.2f}€",
-            "remaining": f"{self.ctrl.remaining_cost:.2f}€",
+            "percent": f"{ctrl.amortisation_percent:.1f}%",
+            "total_savings": f"{total_savings:.2f}€",
+            "remaining": f"{ctrl.remaining_cost:.2f}€",
         }
-        if self.ctrl.is_amortised:
-            profit = self.ctrl.total_savings - self.ctrl.installation_cost
+        if ctrl.is_amortised:
+            profit = total_savings - ctrl.installation_cost
             attrs["profit"] = f"{profit:.2f}€"
         return attrs
 
 
-# =============================================================================
-# ENERGIE-SENSOREN
-# =============================================================================
-
-
-class SelfConsumptionSensor(BaseEntity):
-    """Eigenverbrauch in kWh."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Eigenverbrauch",
-            unit="kWh",
-            icon="mdi:home-lightning-bolt",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            device_class=SensorDeviceClass.ENERGY,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.self_consumption_kwh, 2)
-
-
-class FeedInSensor(BaseEntity):
-    """Netzeinspeisung in kWh."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Einspeisung",
-            unit="kWh",
-            icon="mdi:transmission-tower-export",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            device_class=SensorDeviceClass.ENERGY,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.feed_in_kwh, 2)
-
-
-class PVProductionSensor(BaseEntity):
-    """PV-Produktion in kWh."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "PV Produktion",
-            unit="kWh",
-            icon="mdi:solar-power",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            device_class=SensorDeviceClass.ENERGY,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.pv_production_kwh, 2)
-
-
 # =============================================================================
 # FINANZ-SENSOREN
 # =============================================================================
@@ -405,7 +445,7 @@ class SavingsSelfConsumptionSensor(BaseEntity):
     def native_value(self) -> float:
         return round(self.ctrl.savings_self_consumption, 2)
 
-    @property
+    @tick_cached
     def extra_state_attributes(self):
         return {
             "self_consumption_kwh": f"{self.ctrl.self_consumption_kwh:.2f} kWh",
@@ -441,129 +481,29 @@ class EarningsFeedInSensor(BaseEntity):
 
 
 # =============================================================================
-# EFFIZIENZ-SENSOREN
-# =============================================================================
-
-
-class SelfConsumptionRatioSensor(BaseEntity):
-    """Eigenverbrauchsquote in Prozent."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Eigenverbrauchsquote",
-            unit="%",
-            icon="mdi:home-percent",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.self_consumption_ratio, 1)
-
-
-class AutarkyRateSensor(BaseEntity):
-    """Autarkiegrad in Prozent."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Autarkiegrad",
-            unit="%",
-            icon="mdi:home-battery",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        rate = self.ctrl.autarky_rate
-        if rate is None:
-            return None
-        return round(rate, 1)
-
-
-# =============================================================================
-# STATISTIK-SENSOREN
+# PROGNOSE-SENSOREN
 # =============================================================================
 
 
-class AverageDailySavingsSensor(BaseEntity):
-    """Durchschnittliche tägliche Ersparnis."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Ersparnis pro Tag",
-            unit="€/Tag",
-            icon="mdi:calendar-today",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.average_daily_savings, 2)
-
-
-class AverageMonthlySavingsSensor(BaseEntity):
-    """Durchschnittliche monatliche Ersparnis."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Ersparnis pro Monat",
-            unit="€/Monat",
-            icon="mdi:calendar-month",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.average_monthly_savings, 2)
-
-
-class AverageYearlySavingsSensor(BaseEntity):
-    """Durchschnittliche jährliche Ersparnis."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Ersparnis pro Jahr",
-            unit="€/Jahr",
-            icon="mdi:calendar",
-            state_class=SensorStateClass.MEASUREMENT,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.average_yearly_savings, 2)
-
-
-class DaysSinceInstallationSensor(BaseEntity):
-    """Tage seit Installation."""
+# Konstante Attribute, wenn keine Prognose möglich ist
+_REMAINING_UNKNOWN_ATTRS: Mapping[str, Any] = MappingProxyType({"status": "Berechnung nicht möglich"})
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Tage seit Installation",
-            unit="Tage",
-            icon="mdi:calendar-clock",
-            state_class=SensorStateClass.TOTAL_INCREASING,
-        )
 
-    @property
-    def native_value(self) -> int:
-        return self.ctrl.days_since_installation
+@lru_cache(maxsize=512)
+def _format_remaining(remaining: int) -> tuple[str, int, int, int]:
+    """Resttage als (Text, Jahre, Monate, Tage) - ändert sich höchstens täglich."""
+    years, rest = divmod(remaining, 365)
+    months, days = divmod(rest, 30)
 
+    parts = []
+    if years > 0:
+        parts.append(f"{years} Jahr{'e' if years > 1 else ''}")
+    if months > 0:
+        parts.append(f"{months} Monat{'e' if months > 1 else ''}")
+    if days > 0 or not parts:
+        parts.append(f"{days} Tag{'e' if days != 1 else ''}")
 
-# =============================================================================
-# PROGNOSE-SENSOREN
-# =============================================================================
+    return ", ".join(parts), years, months, days
 
 
 class EstimatedRemainingDaysSensor(BaseEntity):
@@ -587,22 +527,11 @@ class EstimatedRemainingDaysSensor(BaseEntity):
     def extra_state_attributes(self):
         remaining = self.ctrl.estimated_remaining_days
         if remaining is None:
-            return {"status": "Berechnung nicht möglich"}
-
-        years = remaining // 365
-        months = (remaining % 365) // 30
-        days = remaining % 30
-
-        parts = []
-        if years > 0:
-            parts.append(f"{years} Jahr{'e' if years > 1 else ''}")
-        if months > 0:
-            parts.append(f"{months} Monat{'e' if months > 1 else ''}")
-        if days > 0 or not parts:
-            parts.append(f"{days} Tag{'e' if days != 1 else ''}")
+            return _REMAINING_UNKNOWN_ATTRS
 
+        formatted, years, months, days = _format_remaining(remaining)
         return {
-            "formatted": ", ".join(parts),
+            "formatted": formatted,
             "years": years,
             "months": months,
             "days": days,
@@ -654,7 +583,7 @@ class CO2SavedSensor(BaseEntity):
     def native_value(self) -> float:
         return round(self.ctrl.co2_saved_kg, 1)
 
-    @property
+    @tick_cached
     def extra_state_attributes(self):
         kg = self.ctrl.co2_saved_kg
         return {
@@ -669,66 +598,33 @@ class CO2SavedSensor(BaseEntity):
 # =============================================================================
 
 
-class FixedPriceSensor(BaseEntity):
-    """Konfigurierter Fixpreis."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Fixpreis",
-            unit="ct/kWh",
-            icon="mdi:currency-eur",
-            state_class=SensorStateClass.MEASUREMENT,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.fixed_price_ct, 2)
-
-
-class CurrentFeedInTariffSensor(BaseEntity):
-    """Aktuelle Einspeisevergütung."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Einspeisevergütung",
-            unit="€/kWh",
-            icon="mdi:currency-eur",
-            state_class=SensorStateClass.MEASUREMENT,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
+# Quell-Entities im Diagnose-Sensor: (Attribut-Präfix, Controller-Feld)
+_DIAGNOSTIC_SOURCES: tuple[tuple[str, str], ...] = (
+    ("pv_production", "pv_production_entity"),
+    ("grid_export", "grid_export_entity"),
+    ("grid_import", "grid_import_entity"),
+    ("consumption", "consumption_entity"),
+    ("epex_price", "epex_price_entity"),
+)
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.current_feed_in_tariff, 4)
 
+class EntityStatus(NamedTuple):
+    """Status einer Quell-Entity im Diagnose-Sensor."""
 
-class InstallationCostSensor(BaseEntity):
-    """Anschaffungskosten der PV-Anlage."""
+    configured: bool
+    entity_id: str | None
+    state: str | None
+    status: str
 
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Anschaffungskosten",
-            unit="€",
-            icon="mdi:cash",
-            device_class=SensorDeviceClass.MONETARY,
-            entity_category=EntityCategory.DIAGNOSTIC,
-        )
 
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.installation_cost, 2)
+_NOT_CONFIGURED = EntityStatus(False, None, None, "nicht konfiguriert")
 
 
 class ConfigurationDiagnosticSensor(BaseEntity):
     """Diagnose-Sensor zeigt alle konfigurierten Sensoren."""
 
+    __slots__ = ("_entry", "_status_snapshot")
+
     def __init__(self, ctrl, name: str, entry: ConfigEntry):
         super().__init__(
             ctrl,
@@ -738,29 +634,55 @@ class ConfigurationDiagnosticSensor(BaseEntity):
             entity_category=EntityCategory.DIAGNOSTIC,
         )
         self._entry = entry
+        self._status_snapshot: dict[str, EntityStatus] | None = None
 
-    def _get_entity_status(self, entity_id: str | None) -> dict[str, Any]:
+    def _get_entity_status(self, entity_id: str | None) -> EntityStatus:
         """Holt Status einer Entity."""
         if not entity_id:
-            return {"configured": False, "entity_id": None, "state": None, "status": "nicht konfiguriert"}
+            return _NOT_CONFIGURED
 
         state = self.hass.states.get(entity_id)
         if state is None:
-            return {"configured": True, "entity_id": entity_id, "state": None, "status": "nicht gefunden"}
+            return EntityStatus(True, entity_id, None, "nicht gefunden")
         elif state.state in ("unavailable", "unknown"):
-            return {"configured": True, "entity_id": entity_id, "state": state.state, "status": "nicht verfügbar"}
+            return EntityStatus(True, entity_id, state.state, "nicht verfügbar")
         else:
-            return {"configured": True, "entity_id": entity_id, "state": state.state, "status": "OK"}
+            return EntityStatus(True, entity_id, state.state, "OK")
+
+    def _collect_statuses(self) -> dict[str, EntityStatus]:
+        """Status aller Quell-Entities (live aus hass.states)."""
+        ctrl = self.ctrl
+        return {
+            prefix: self._get_entity_status(getattr(ctrl, ctrl_attr))
+            for prefix, ctrl_attr in _DIAGNOSTIC_SOURCES
+        }
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Quell-Status einmal pro Schreibvorgang - auch bei Registry-Updates aktuell."""
+        self._status_snapshot = self._collect_statuses()
+        try:
+            super().async_write_ha_state()
+        finally:
+            self._status_snapshot = None
+
+    @property
+    def _statuses(self) -> dict[str, EntityStatus]:
+        """Status-Snapshot des laufenden Schreibvorgangs, sonst live."""
+        if self._status_snapshot is not None:
+            return self._status_snapshot
+        return self._collect_statuses()
 
     @property
     def native_value(self) -> str:
         """Zeigt Gesamtstatus der Konfiguration."""
+        statuses = self._statuses
         issues = 0
-        for entity_id in [self.ctrl.pv_production_entity, self.ctrl.grid_export_entity]:
-            if entity_id:
-                status = self._get_entity_status(entity_id)
-                if status["status"] != "OK":
-                    issues += 1
+        # Nur PV und Export sind für die Berechnung zwingend
+        for key in ("pv_production", "grid_export"):
+            status = statuses[key]
+            if status.configured and status.status != "OK":
+                issues += 1
         if issues == 0:
             return "OK"
         else:
@@ -768,31 +690,22 @@ class ConfigurationDiagnosticSensor(BaseEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        pv_status = self._get_entity_status(self.ctrl.pv_production_entity)
-        export_status = self._get_entity_status(self.ctrl.grid_export_entity)
-        import_status = self._get_entity_status(self.ctrl.grid_import_entity)
-        consumption_status = self._get_entity_status(self.ctrl.consumption_entity)
-        epex_status = self._get_entity_status(self.ctrl.epex_price_entity)
-
-        return {
-            "pv_production_entity": pv_status["entity_id"],
-            "pv_production_status": pv_status["status"],
-            "grid_export_entity": export_status["entity_id"],
-            "grid_export_status": export_status["status"],
-            "grid_import_entity": import_status["entity_id"],
-            "grid_import_status": import_status["status"],
-            "consumption_entity": consumption_status["entity_id"],
-            "consumption_status": consumption_status["status"],
-            "epex_price_entity": epex_status["entity_id"],
-            "epex_price_status": epex_status["status"],
-            "fixed_price_ct": f"{self.ctrl.fixed_price_ct:.2f}",
-            "feed_in_tariff_eur": f"{self.ctrl.current_feed_in_tariff:.4f}",
-            "tracked_self_consumption_kwh": round(self.ctrl._total_self_consumption_kwh, 4),
-            "tracked_feed_in_kwh": round(self.ctrl._total_feed_in_kwh, 4),
-            "first_seen_date": self.ctrl._first_seen_date.isoformat() if self.ctrl._first_seen_date else None,
-            "days_tracked": self.ctrl.days_since_installation,
-            "has_epex_integration": self.ctrl.has_epex_integration,
-        }
+        ctrl = self.ctrl
+        attrs: dict[str, Any] = {}
+        for prefix, status in self._statuses.items():
+            attrs[f"{prefix}_entity"] = status.entity_id
+            attrs[f"{prefix}_status"] = status.status
+
+        attrs.update({
+            "fixed_price_ct": f"{ctrl.fixed_price_ct:.2f}",
+            "feed_in_tariff_eur": f"{ctrl.current_feed_in_tariff:.4f}",
+            "tracked_self_consumption_kwh": round(ctrl._total_self_consumption_kwh, 4),
+            "tracked_feed_in_kwh": round(ctrl._total_feed_in_kwh, 4),
+            "first_seen_date": ctrl._first_seen_date.isoformat() if ctrl._first_seen_date else None,
+            "days_tracked": ctrl.days_since_installation,
+            "has_epex_integration": ctrl.has_epex_integration,
+        })
+        return attrs
 
     @property
     def icon(self) -> str:
@@ -828,14 +741,19 @@ class TotalGridImportCostSensor(BaseEntity):
 
     @property
     def extra_state_attributes(self) -> dict:
-        avg = self.ctrl.average_electricity_price_ct
+        ctrl = self.ctrl
+        avg = ctrl.average_electricity_price_ct
         return {
-            "verbrauch_kwh": round(self.ctrl.tracked_grid_import_kwh, 2),
+            "verbrauch_kwh": round(ctrl.tracked_grid_import_kwh, 2),
             "durchschnittspreis_ct": f"{avg:.2f}" if avg else None,
-            "hinweis": "Kosten wenn Spot-Tarif" if self.ctrl.has_epex_integration else "Gleich wie Fixpreis",
+            "hinweis": "Kosten wenn Spot-Tarif" if ctrl.has_epex_integration else "Gleich wie Fixpreis",
         }
 
 
+# Icon nach Vorzeichen der Ersparnis: Spot günstiger / gleich / Fixpreis günstiger
+_COMPARE_ICONS: tuple[str, ...] = ("mdi:thumb-down", "mdi:scale-balance", "mdi:thumb-up")
+
+
 class FixedVsSpotSensor(BaseEntity):
     """
     Vergleich Fixpreis vs. Spot-Tarif.
@@ -867,18 +785,15 @@ class FixedVsSpotSensor(BaseEntity):
         savings = self.ctrl.spot_vs_fixed_savings
         if savings is None:
             return "mdi:scale-balance"
-        elif savings > 0:
-            return "mdi:thumb-up"  # Fixpreis günstiger
-        elif savings < 0:
-            return "mdi:thumb-down"  # Spot wäre günstiger
-        return "mdi:scale-balance"
+        return _COMPARE_ICONS[(savings > 0) - (savings < 0) + 1]
 
     @property
     def extra_state_attributes(self) -> dict:
-        fixed_ct = self.ctrl.fixed_price_ct
-        avg_spot_ct = self.ctrl.average_electricity_price_ct
-        savings = self.ctrl.spot_vs_fixed_savings
-        kwh = self.ctrl.tracked_grid_import_kwh
+        ctrl = self.ctrl
+        fixed_ct = ctrl.fixed_price_ct
+        avg_spot_ct = ctrl.average_electricity_price_ct
+        savings = ctrl.spot_vs_fixed_savings
+        kwh = ctrl.tracked_grid_import_kwh
 
         attrs = {
             "fixpreis_ct": round(fixed_ct, 2),
@@ -888,10 +803,10 @@ class FixedVsSpotSensor(BaseEntity):
 
         if avg_spot_ct and kwh > 0:
             fixed_cost = kwh * (fixed_ct / 100)
-            spot_cost = self.ctrl.total_grid_import_cost
+            spot_cost = ctrl.total_grid_import_cost
             attrs["fixpreis_kosten_eur"] = round(fixed_cost, 2)
             attrs["spot_kosten_eur"] = round(spot_cost, 2)
-            attrs["differenz_pro_kwh_ct"] = round(avg_spot_ct - fixed_ct, 2) if avg_spot_ct else None
+            attrs["differenz_pro_kwh_ct"] = round(avg_spot_ct - fixed_ct, 2)
 
             if savings and savings > 0:
                 attrs["fazit"] = f"Fixpreis {abs(savings):.2f}€ günstiger"
@@ -900,7 +815,7 @@ class FixedVsSpotSensor(BaseEntity):
             else:
                 attrs["fazit"] = "Etwa gleich"
 
-        if not self.ctrl.has_epex_integration:
+        if not ctrl.has_epex_integration:
             attrs["hinweis"] = "Kein EPEX Sensor konfiguriert - Vergleich nicht möglich"
 
         return attrs
@@ -932,32 +847,15 @@ class QuotaRemainingSensor(BaseEntity):
 
     @property
     def extra_state_attributes(self) -> dict:
+        ctrl = self.ctrl
+        monthly_rate = ctrl.quota_monthly_rate
         return {
-            "jahres_kontingent_kwh": self.ctrl.quota_yearly_kwh,
-            "verbraucht_kwh": round(self.ctrl.quota_consumed_kwh, 1),
-            "abschlag_eur": self.ctrl.quota_monthly_rate if self.ctrl.quota_monthly_rate > 0 else None,
+            "jahres_kontingent_kwh": ctrl.quota_yearly_kwh,
+            "verbraucht_kwh": round(ctrl.quota_consumed_kwh, 1),
+            "abschlag_eur": monthly_rate if monthly_rate > 0 else None,
         }
 
 
-class QuotaConsumedPercentSensor(BaseEntity):
-    """Kontingent Verbrauch - Prozent des Jahres-Kontingents verbraucht."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Kontingent Verbrauch",
-            unit="%",
-            icon="mdi:gauge",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_QUOTA,
-        )
-
-    @property
-    def native_value(self) -> float:
-        return round(self.ctrl.quota_consumed_percent, 1)
-
-
 class QuotaReserveSensor(BaseEntity):
     """Kontingent Reserve - positiv = unter Budget, negativ = drüber."""
 
@@ -972,13 +870,18 @@ class QuotaReserveSensor(BaseEntity):
             device_type=DEVICE_QUOTA,
         )
 
+    @tick_cached
+    def _reserve(self) -> float:
+        """quota_reserve_kwh einmal pro Update (Wert und Icon)."""
+        return self.ctrl.quota_reserve_kwh
+
     @property
     def native_value(self) -> float:
-        return round(self.ctrl.quota_reserve_kwh, 1)
+        return round(self._reserve, 1)
 
     @property
     def icon(self) -> str:
-        reserve = self.ctrl.quota_reserve_kwh
+        reserve = self._reserve
         if reserve >= 0:
             return "mdi:shield-check"
         return "mdi:shield-alert"
@@ -991,28 +894,6 @@ class QuotaReserveSensor(BaseEntity):
         }
 
 
-class QuotaDailyBudgetSensor(BaseEntity):
-    """Kontingent Tagesbudget - wieviel pro Tag noch verbrauchen darf."""
-
-    def __init__(self, ctrl, name: str):
-        super().__init__(
-            ctrl,
-            name,
-            "Kontingent Tagesbudget",
-            unit="kWh/Tag",
-            icon="mdi:calendar-today",
-            state_class=SensorStateClass.MEASUREMENT,
-            device_type=DEVICE_QUOTA,
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        budget = self.ctrl.quota_daily_budget_kwh
-        if budget is None:
-            return None
-        return round(budget, 1)
-
-
 class QuotaForecastSensor(BaseEntity):
     """Kontingent Prognose - Hochrechnung Verbrauch am Periodenende."""
 
@@ -1027,16 +908,21 @@ class QuotaForecastSensor(BaseEntity):
             device_type=DEVICE_QUOTA,
         )
 
+    @tick_cached
+    def _forecast(self) -> float | None:
+        """quota_forecast_kwh einmal pro Update (Wert, Icon und Attribute)."""
+        return self.ctrl.quota_forecast_kwh
+
     @property
     def native_value(self) -> float | None:
-        forecast = self.ctrl.quota_forecast_kwh
+        forecast = self._forecast
         if forecast is None:
             return None
         return round(forecast, 0)
 
     @property
     def icon(self) -> str:
-        forecast = self.ctrl.quota_forecast_kwh
+        forecast = self._forecast
         if forecast is None:
             return "mdi:crystal-ball"
         if forecast <= self.ctrl.quota_yearly_kwh:
@@ -1045,7 +931,7 @@ class QuotaForecastSensor(BaseEntity):
 
     @property
     def extra_state_attributes(self) -> dict:
-        forecast = self.ctrl.quota_forecast_kwh
+        forecast = self._forecast
         attrs = {
             "kontingent_kwh": self.ctrl.quota_yearly_kwh,
         }
@@ -1114,18 +1000,20 @@ class QuotaStatusSensor(BaseEntity):
 
     @property
     def extra_state_attributes(self) -> dict:
+        ctrl = self.ctrl
         attrs = {
-            "verbraucht_kwh": round(self.ctrl.quota_consumed_kwh, 1),
-            "verbleibend_kwh": round(self.ctrl.quota_remaining_kwh, 1),
-            "reserve_kwh": round(self.ctrl.quota_reserve_kwh, 1),
-            "verbrauch_prozent": round(self.ctrl.quota_consumed_percent, 1),
+            "verbraucht_kwh": round(ctrl.quota_consumed_kwh, 1),
+            "verbleibend_kwh": round(ctrl.quota_remaining_kwh, 1),
+            "reserve_kwh": round(ctrl.quota_reserve_kwh, 1),
+            "verbrauch_prozent": round(ctrl.quota_consumed_percent, 1),
         }
-        forecast = self.ctrl.quota_forecast_kwh
+        forecast = ctrl.quota_forecast_kwh
         if forecast is not None:
             attrs["prognose_kwh"] = round(forecast, 0)
-        budget = self.ctrl.quota_daily_budget_kwh
+        budget = ctrl.quota_daily_budget_kwh
         if budget is not None:
             attrs["tagesbudget_kwh"] = round(budget, 1)
-        if self.ctrl.quota_monthly_rate > 0:
-            attrs["monatlicher_abschlag_eur"] = self.ctrl.quota_monthly_rate
+        monthly_rate = ctrl.quota_monthly_rate
+        if monthly_rate > 0:
+            attrs["monatlicher_abschlag_eur"] = monthly_rate
         return attrs